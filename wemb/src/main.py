@@ -6,7 +6,6 @@ import signal
 import sys
 from enum import Enum, unique
 from pathlib import Path
-from time import sleep
 from typing import List, Optional, Union
 
 import praw
@@ -16,13 +15,18 @@ from praw import Reddit
 from praw.models import Submission
 
 
+def __configure_logging():
+    """Sets basic logging configuration for the root logger. Only has an effect if nothing else has configured logging yet"""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            stream=sys.stdout,
+            format="{asctime} - {name:<12} {levelname:<8}:  {message}",
+            style="{",
+        )
+
+
 def __get_logger() -> logging.Logger:
-    """Sets basic logging configuration and returns the logger for this module. Reads an env var called WEMB_LOGLEVEL to set the log level"""
-    logging.basicConfig(
-        stream=sys.stdout,
-        format="{asctime} - {name:<12} {levelname:<8}:  {message}",
-        style="{",
-    )
+    """Returns the logger for this module. Reads an env var called WEMB_LOGLEVEL to set the log level"""
 
     # Get log level from env var
     log_level = os.environ.get("WEMB_LOGLEVEL") or logging.DEBUG
@@ -33,11 +37,16 @@ def __get_logger() -> logging.Logger:
         logger.setLevel(log_level)
     except ValueError:
         logger.setLevel(logging.DEBUG)
-        logger.warning(f"Invalid WEMB_LOGLEVEL ({log_level})! Defaulting to DEBUG...")
+        logger.warning("Invalid WEMB_LOGLEVEL (%s)! Defaulting to DEBUG...", log_level)
 
     return logger
 
 
+def __get_http_session() -> requests.Session:
+    """Returns a requests session shared by all webhook calls, so they reuse keep-alive connections to the webhook host instead of opening a new one every time"""
+    return requests.Session()
+
+
 @unique
 class SubmissionType(Enum):
     """Represents a type of submission (either WTS or WTB)"""
@@ -62,13 +71,19 @@ class SubmissionCriterion:
     @staticmethod
     def __process_keywords(initial: Optional[List[str]]) -> List[str]:
         keywords = list()
+        seen = set()
+
+        if initial is not None:
+            # Lowercase once here so check_title doesn't have to, and drop duplicates (keeping order)
+            for element in initial:
+                keyword = element.lower()
+                if keyword and keyword not in seen:
+                    seen.add(keyword)
+                    keywords.append(keyword)
 
-        if initial is None or len(initial) == 0:
+        if len(keywords) == 0:
             # Append an empty string item so loop logic works
             keywords.append("")
-        else:
-            for element in initial:
-                keywords.append(element.lower())
 
         return keywords
 
@@ -141,7 +156,7 @@ class ProgramConfiguration:
                 )
             )
 
-        LOGGER.debug(f"  Loaded {len(self.criteria)} criteria: {self.criteria}")
+        LOGGER.debug("  Loaded %d criteria: %s", len(self.criteria), self.criteria)
 
         self.webhookUrl = contents["callback"]["webhookUrl"]
         self.mentionString = contents["callback"]["mentionString"]
@@ -149,7 +164,11 @@ class ProgramConfiguration:
 
 RE_TRANSACTIONS = re.compile(r"^\d+")
 SUBREDDIT_WATCHEXCHANGE = "watchexchange"
+# (connect, read) timeout in seconds for webhook calls, so a slow Discord response can't stall the stream
+WEBHOOK_TIMEOUT = (5, 10)
+__configure_logging()
 LOGGER = __get_logger()
+HTTP_SESSION = __get_http_session()
 
 
 def get_permalink(reddit: Reddit, submission: Submission):
@@ -175,7 +194,7 @@ def check_criteria(criterion: SubmissionCriterion, submission: Submission) -> bo
             LOGGER.debug("    Failed on minimum transaction count (2/2)")
             return False
     except TypeError:
-        LOGGER.warning(f"    Submission has INVALID user flair!")
+        LOGGER.warning("    Submission has INVALID user flair!")
         return False
 
     # If both gates have been passed, we have matched all criteria
@@ -195,15 +214,16 @@ def process_submissions(reddit: praw.Reddit, args, callback=None):
     for submission in reddit.subreddit(SUBREDDIT_WATCHEXCHANGE).stream.submissions():
 
         LOGGER.info("")
-        LOGGER.info(f"Incoming submission ({submission.id}):")
-        LOGGER.debug(f"  URL: {get_permalink(reddit, submission)}")
-        LOGGER.debug(f"  Title: {submission.title}")
-        LOGGER.debug(f"  Flair: {submission.author_flair_text}")
+        LOGGER.info("Incoming submission (%s):", submission.id)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("  URL: %s", get_permalink(reddit, submission))
+            LOGGER.debug("  Title: %s", submission.title)
+            LOGGER.debug("  Flair: %s", submission.author_flair_text)
 
         # This is a new post, so we have to analyze it with respect to the criteria.
         for criterion in config.criteria:
 
-            LOGGER.info(f"  Checking {criterion}...")
+            LOGGER.info("  Checking %s...", criterion)
 
             if check_criteria(criterion, submission):
                 LOGGER.info("    Matched! Sending message...")
@@ -217,19 +237,28 @@ def post_discord_message(
 ):
     """Posts a message using a webhook, including the submission URL and mentioning a user/role"""
 
-    response = requests.post(
-        webhook_url,
-        json={
-            "content": f"{mention_string} {get_permalink(reddit, submission)}",
-        },
-    )
-
-    LOGGER.debug(f"Response: {response}")
+    try:
+        response = HTTP_SESSION.post(
+            webhook_url,
+            json={
+                "content": f"{mention_string} {get_permalink(reddit, submission)}",
+            },
+            timeout=WEBHOOK_TIMEOUT,
+        )
+        # Treat 4xx/5xx answers (bad webhook URL, rate limits, etc.) as failures too
+        response.raise_for_status()
+    except requests.RequestException as e:
+        LOGGER.error("Failed to send webhook message: %s", e)
+        return
+
+    LOGGER.debug("Response: %s", response)
 
 
 def __signal_handler(signum, frame):
     LOGGER.info("SIGINT/SIGTERM Captured! Exiting...")
-    sleep(1)
+
+    # Close pooled webhook connections cleanly before exiting
+    HTTP_SESSION.close()
     sys.exit(0)
 
 